@@ -53,6 +53,8 @@ from core.utils import extract_block_timestamp, normalize_alias, parse_alias, tr
 logger = getLogger(__name__)
 
 
+_STRIP_PUNCTUATION = str.maketrans("", "", string.punctuation)
+
 temp_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp")
 if not os.path.exists(temp_dir):
     os.mkdir(temp_dir)
@@ -248,6 +250,7 @@ class ModmailBot(commands.Bot):
                 except Exception:
                     logger.critical("Fatal exception", exc_info=True)
                 finally:
+                    self.threads.shutdown()
                     if self.session:
                         await self.session.close()
                     if not self.is_closed():
@@ -515,6 +518,9 @@ class ModmailBot(commands.Bot):
         return level
 
     async def on_connect(self):
+        # channel events may have been missed while disconnected
+        self.threads.invalidate_topic_index()
+
         try:
             await self.api.validate_database_connection()
         except Exception:
@@ -1356,10 +1362,27 @@ class ModmailBot(commands.Bot):
         if self.config["transfer_reactions"]:
             await self.handle_reaction_events(payload)
 
+    async def on_guild_channel_create(self, channel):
+        if channel.guild != self.modmail_guild or not isinstance(channel, discord.TextChannel):
+            return
+
+        self.threads.index_channel(channel)
+
+    async def on_guild_channel_update(self, before, after):
+        if after.guild != self.modmail_guild or not isinstance(after, discord.TextChannel):
+            return
+
+        if before.topic != after.topic:
+            self.threads.unindex_channel(before)
+            self.threads.index_channel(after)
+
     async def on_guild_channel_delete(self, channel):
         if channel.guild != self.modmail_guild:
             return
 
+        if isinstance(channel, discord.TextChannel):
+            self.threads.unindex_channel(channel)
+
         if isinstance(channel, discord.CategoryChannel):
             if self.main_category == channel:
                 logger.debug("Main category was deleted.")
@@ -1741,12 +1764,13 @@ class ModmailBot(commands.Bot):
                 if force_null:
                     name = "null"
 
-                name = new_name = (
-                    "".join(l for l in name if l not in string.punctuation and l.isprintable()) or "null"
-                ) + f"-{author.discriminator}"
+                name = name.translate(_STRIP_PUNCTUATION)
+                if not name.isprintable():
+                    name = "".join(l for l in name if l.isprintable())
+                name = new_name = (name or "null") + f"-{author.discriminator}"
 
         counter = 1
-        existed = set(c.name for c in guild.text_channels if c != exclude_channel)
+        existed = {c.name for c in guild.text_channels if c != exclude_channel}
         while new_name in existed:
             new_name = f"{name}_{counter}"  # multiple channels with same name
             counter += 1
@@ -1,13 +1,16 @@
 import asyncio
 import base64
 import copy
-import functools
+import heapq
 import io
+import multiprocessing
 import re
 import time
 import traceback
 import typing
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import timedelta
 from types import SimpleNamespace
 
@@ -33,6 +36,36 @@ from core.utils import (
 
 logger = getLogger(__name__)
 
+# strong references to fire-and-forget tasks, so they aren't garbage collected mid-flight
+_background_tasks = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Schedules a fire-and-forget coroutine, holding a reference to it until it is done."""
+    task = asyncio.ensure_future(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def _lottie_to_png(data: bytes) -> bytes:
+    # module level so that it can be pickled into the process pool
+    importer = l_importers.get("lottie")
+    exporter = l_exporters.get("png")
+    # BytesIO shares the buffer of its initial bytes until it is written to
+    with io.BytesIO(data) as stream:
+        an = importer.process(stream)
+
+    with io.BytesIO() as stream:
+        exporter.process(an, stream)
+        return stream.getvalue()
+
+
+# seconds before an idle sticker rendering worker exits
+PROCESS_POOL_IDLE_TIMEOUT = 60
+
+URL_REGEX = re.compile(r"http[s]?:\/\/(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+")
+
 
 class Thread:
     """Represents a discord Modmail thread"""
@@ -54,6 +87,8 @@ class Thread:
                 raise CommandError("Recipient cannot be a bot.")
             self._id = recipient.id
             self._recipient = recipient
+        # key of this thread in the config dicts (closures, subscriptions, etc)
+        self._id_key = str(self._id)
         self._other_recipients = other_recipients or []
         self._channel = channel
         self._genesis_message = None
@@ -150,6 +185,7 @@ class Thread:
                 if m.author == self.bot.user:
                     if m.embeds and m.embeds[0].fields and m.embeds[0].fields[0].name == "Roles":
                         self._genesis_message = m
+                        break
 
         return self._genesis_message
 
@@ -166,10 +202,14 @@ class Thread:
         if category is not None:
             overwrites = {}
 
+        # the past logs only depend on the recipient, fetch them while the channel is created
+        user_logs_task = _spawn(self.bot.api.get_user_logs(recipient.id))
+
         try:
             channel = await create_thread_channel(self.bot, recipient, category, overwrites)
         except discord.HTTPException as e:  # Failed to create due to missing perms.
             logger.critical("An error occurred while creating a thread.", exc_info=True)
+            user_logs_task.cancel()
             self.manager.cache.pop(self.id)
 
             embed = discord.Embed(color=self.bot.error_color)
@@ -186,7 +226,7 @@ class Thread:
         try:
             log_url, log_data = await asyncio.gather(
                 self.bot.api.create_log_entry(recipient, channel, creator or recipient),
-                self.bot.api.get_user_logs(recipient.id),
+                user_logs_task,
             )
 
             log_count = sum(1 for log in log_data if not log["open"])
@@ -206,7 +246,7 @@ class Thread:
             info_embed = self._format_info_embed(recipient, log_url, log_count, self.bot.main_color)
             try:
                 msg = await channel.send(mention, embed=info_embed)
-                self.bot.loop.create_task(msg.pin())
+                _spawn(msg.pin())
                 self._genesis_message = msg
             except Exception:
                 logger.error("Failed unexpectedly:", exc_info=True)
@@ -358,16 +398,12 @@ class Thread:
         else:
             embed.description += "."
 
-        mutual_guilds = [g for g in self.bot.guilds if user in g.members]
+        mutual_guilds = [g for g in self.bot.guilds if g.get_member(user.id) is not None]
         if member is None or len(mutual_guilds) > 1:
             embed.add_field(name="Mutual Server(s)", value=", ".join(g.name for g in mutual_guilds))
 
         return embed
 
-    async def _close_after(self, after, closer, silent, delete_channel, message):
-        await asyncio.sleep(after)
-        return self.bot.loop.create_task(self._close(closer, silent, delete_channel, message, True))
-
     async def close(
         self,
         *,
@@ -380,8 +416,8 @@ class Thread:
     ) -> None:
         """Close a thread now or after a set time in seconds"""
 
-        # restarts the after timer
-        await self.cancel_closure(auto_close)
+        # restarts the after timer, the closures config is persisted when rescheduling or by _close
+        await self.cancel_closure(auto_close, update=False)
 
         if after > 0:
             # TODO: Add somewhere to clean up broken closures
@@ -396,15 +432,17 @@ class Thread:
                 "message": message,
                 "auto_close": auto_close,
             }
-            self.bot.config["closures"][str(self.id)] = items
+            self.bot.config["closures"][self._id_key] = items
             await self.bot.config.update()
 
-            task = asyncio.create_task(self._close_after(after, closer, silent, delete_channel, message))
+            closure = self.manager.schedule_closure(
+                self, after, closer=closer, silent=silent, delete_channel=delete_channel, message=message
+            )
 
             if auto_close:
-                self.auto_close_task = task
+                self.auto_close_task = closure
             else:
-                self.close_task = task
+                self.close_task = closure
         else:
             await self._close(closer, silent, delete_channel, message)
 
@@ -415,34 +453,46 @@ class Thread:
             logger.error("Thread already closed: %s.", e)
             return
 
-        await self.cancel_closure(all=True)
+        # config is persisted along with the log below
+        await self.cancel_closure(all=True, update=False)
 
         # Cancel auto closing the thread if closed by any means.
 
-        self.bot.config["subscriptions"].pop(str(self.id), None)
-        self.bot.config["notification_squad"].pop(str(self.id), None)
+        self.bot.config["subscriptions"].pop(self._id_key, None)
+        self.bot.config["notification_squad"].pop(self._id_key, None)
+
+        async def update_config():
+            # a failed config write shouldn't stop the rest of the close sequence
+            try:
+                await self.bot.config.update()
+            except Exception:
+                logger.error("Failed to update config while closing a thread.", exc_info=True)
 
         # Logging
         if self.channel:
-            log_data = await self.bot.api.post_log(
-                self.channel.id,
-                {
-                    "open": False,
-                    "title": match_title(self.channel.topic),
-                    "closed_at": str(discord.utils.utcnow()),
-                    "nsfw": self.channel.nsfw,
-                    "close_message": message,
-                    "closer": {
-                        "id": str(closer.id),
-                        "name": closer.name,
-                        "discriminator": closer.discriminator,
-                        "avatar_url": closer.display_avatar.url,
-                        "mod": True,
+            log_data, _ = await asyncio.gather(
+                self.bot.api.post_log(
+                    self.channel.id,
+                    {
+                        "open": False,
+                        "title": match_title(self.channel.topic),
+                        "closed_at": str(discord.utils.utcnow()),
+                        "nsfw": self.channel.nsfw,
+                        "close_message": message,
+                        "closer": {
+                            "id": str(closer.id),
+                            "name": closer.name,
+                            "discriminator": closer.discriminator,
+                            "avatar_url": closer.display_avatar.url,
+                            "mod": True,
+                        },
                     },
-                },
+                ),
+                update_config(),
             )
         else:
             log_data = None
+            await update_config()
 
         if isinstance(log_data, dict):
             prefix = self.bot.config["log_url_prefix"].strip("/")
@@ -490,7 +540,7 @@ class Thread:
         embed.set_footer(text=f"{event} by {_closer}", icon_url=closer.display_avatar.url)
         embed.timestamp = discord.utils.utcnow()
 
-        tasks = [self.bot.config.update()]
+        tasks = []
 
         if self.bot.log_channel is not None and self.channel is not None:
             if self.bot.config["show_log_url_button"]:
@@ -541,7 +591,7 @@ class Thread:
         await asyncio.gather(*tasks)
         self.bot.dispatch("thread_close", self, closer, silent, delete_channel, message, scheduled)
 
-    async def cancel_closure(self, auto_close: bool = False, all: bool = False) -> None:
+    async def cancel_closure(self, auto_close: bool = False, all: bool = False, update: bool = True) -> None:
         if self.close_task is not None and (not auto_close or all):
             self.close_task.cancel()
             self.close_task = None
@@ -549,8 +599,8 @@ class Thread:
             self.auto_close_task.cancel()
             self.auto_close_task = None
 
-        to_update = self.bot.config["closures"].pop(str(self.id), None)
-        if to_update is not None:
+        to_update = self.bot.config["closures"].pop(self._id_key, None)
+        if to_update is not None and update:
             await self.bot.config.update()
 
     async def _restart_close_timer(self):
@@ -578,13 +628,14 @@ class Thread:
             self.bot.config["thread_auto_close_response"], timeout=human_time
         )
 
-        time_marker_regex = "%t"
-        if len(re.findall(time_marker_regex, close_message)) == 1:
-            close_message = re.sub(time_marker_regex, str(human_time), close_message)
-        elif len(re.findall(time_marker_regex, close_message)) > 1:
+        time_marker = "%t"
+        time_marker_count = close_message.count(time_marker)
+        if time_marker_count == 1:
+            close_message = close_message.replace(time_marker, str(human_time))
+        elif time_marker_count > 1:
             logger.warning(
                 "The thread_auto_close_response should only contain one '%s' to specify time.",
-                time_marker_regex,
+                time_marker,
             )
 
         await self.close(closer=self.bot.user, after=int(seconds), message=close_message, auto_close=True)
@@ -627,7 +678,7 @@ class Thread:
             ):
                 raise ValueError("Thread message not found.")
         else:
-            async for message1 in self.channel.history():
+            async for message1 in self.channel.history(limit=100):
                 if (
                     message1.embeds
                     and message1.embeds[0].author.url
@@ -650,7 +701,7 @@ class Thread:
 
         messages = [message1]
         for user in self.recipients:
-            async for msg in user.history():
+            async for msg in user.history(limit=100):
                 if either_direction:
                     if msg.id == joint_id:
                         return message1, msg
@@ -725,7 +776,7 @@ class Thread:
 
         linked_messages = []
         if self.channel is not None:
-            async for msg in self.channel.history():
+            async for msg in self.channel.history(limit=100):
                 if not msg.embeds:
                     continue
 
@@ -759,7 +810,7 @@ class Thread:
         for user in self.recipients:
             if user.dm_channel == message.channel:
                 continue
-            async for other_msg in user.history():
+            async for other_msg in user.history(limit=100):
                 if either_direction:
                     if other_msg.id == joint_id:
                         linked_messages.append(other_msg)
@@ -806,7 +857,7 @@ class Thread:
             thread_creation=thread_creation,
         )
 
-        self.bot.loop.create_task(
+        _spawn(
             self.bot.api.append_log(message, message_id=msg.id, channel_id=self.channel.id, type_="system")
         )
 
@@ -911,12 +962,12 @@ class Thread:
     ) -> None:
 
         if not note and from_mod:
-            self.bot.loop.create_task(self._restart_close_timer())  # Start or restart thread auto close
+            _spawn(self._restart_close_timer())  # Start or restart thread auto close
 
         if self.close_task is not None:
             # cancel closing if a thread message is sent.
-            self.bot.loop.create_task(self.cancel_closure())
-            self.bot.loop.create_task(
+            _spawn(self.cancel_closure())
+            _spawn(
                 self.channel.send(
                     embed=discord.Embed(
                         color=self.bot.error_color,
@@ -929,10 +980,22 @@ class Thread:
             await self.wait_until_ready()
 
         if not from_mod and not note:
-            self.bot.loop.create_task(self.bot.api.append_log(message, channel_id=self.channel.id))
+            _spawn(self.bot.api.append_log(message, channel_id=self.channel.id))
 
         destination = destination or self.channel
 
+        async def trigger_typing():
+            try:
+                await destination.typing()
+            except discord.NotFound:
+                # the message send below raises the error to the caller
+                logger.warning("Channel not found.")
+            except discord.HTTPException as e:
+                logger.debug("Failed to trigger typing: %s.", e)
+
+        # overlap the typing request with building the message, it is awaited before sending
+        typing_task = _spawn(trigger_typing())
+
         author = message.author
         member = self.bot.guild.get_member(author.id)
         if member:
@@ -980,40 +1043,18 @@ class Thread:
                 url=f"https://discordapp.com/users/{author.id}#{message.id}",
             )
 
-        ext = [(a.url, a.filename, False) for a in message.attachments]
-
         images = []
         attachments = []
-        for attachment in ext:
-            if is_image_url(attachment[0]):
-                images.append(attachment)
+        for a in message.attachments:
+            if is_image_url(a.url):
+                images.append((a.url, a.filename, False))
             else:
-                attachments.append(attachment)
+                attachments.append((a.url, a.filename, False))
 
-        image_urls = re.findall(
-            r"http[s]?:\/\/(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
-            message.content,
-        )
-
-        image_urls = [
-            (is_image_url(url, convert_size=False), None, False)
-            for url in image_urls
-            if is_image_url(url, convert_size=False)
-        ]
-        images.extend(image_urls)
-
-        def lottie_to_png(data):
-            importer = l_importers.get("lottie")
-            exporter = l_exporters.get("png")
-            with io.BytesIO() as stream:
-                stream.write(data)
-                stream.seek(0)
-                an = importer.process(stream)
-
-            with io.BytesIO() as stream:
-                exporter.process(an, stream)
-                stream.seek(0)
-                return stream.read()
+        for url in URL_REGEX.findall(message.content):
+            image_url = is_image_url(url, convert_size=False)
+            if image_url:
+                images.append((image_url, None, False))
 
         for i in message.stickers:
             if i.format in (discord.StickerFormatType.png, discord.StickerFormatType.apng):
@@ -1025,9 +1066,7 @@ class Thread:
                         data = await resp.read()
 
                     # convert to a png
-                    img_data = await self.bot.loop.run_in_executor(
-                        None, functools.partial(lottie_to_png, data)
-                    )
+                    img_data = await self.manager.run_in_process_pool(_lottie_to_png, data)
                     b64_data = base64.b64encode(img_data).decode()
 
                     # upload to imgur
@@ -1130,11 +1169,8 @@ class Thread:
         ):
             logger.info("Sending a message to %s when DM disabled is set.", self.recipient)
 
-        try:
-            await destination.typing()
-        except discord.NotFound:
-            logger.warning("Channel not found.")
-            raise
+        # typing must land before the message, otherwise it lingers after it was sent
+        await typing_task
 
         if not from_mod and not note:
             mentions = await self.get_notifications()
@@ -1175,7 +1211,7 @@ class Thread:
         return msg
 
     async def get_notifications(self) -> str:
-        key = str(self.id)
+        key = self._id_key
 
         mentions = []
         mentions.extend(self.bot.config["subscriptions"].get(key, []))
@@ -1183,7 +1219,7 @@ class Thread:
         if key in self.bot.config["notification_squad"]:
             mentions.extend(self.bot.config["notification_squad"][key])
             self.bot.config["notification_squad"].pop(key)
-            self.bot.loop.create_task(self.bot.config.update())
+            self.manager.schedule_config_flush()
 
         return " ".join(set(mentions))
 
@@ -1256,16 +1292,212 @@ class Thread:
         await self._update_users_genesis()
 
 
+class ScheduledClosure:
+    """A pending thread closure, ordered by its deadline in the closure heap."""
+
+    __slots__ = ("deadline", "thread", "kwargs", "cancelled", "manager")
+
+    def __init__(self, manager: "ThreadManager", deadline: float, thread: Thread, kwargs: dict):
+        self.manager = manager  # None once the closure left the heap
+        self.deadline = deadline
+        self.thread = thread
+        self.kwargs = kwargs
+        self.cancelled = False
+
+    def __lt__(self, other: "ScheduledClosure") -> bool:
+        return self.deadline < other.deadline
+
+    def cancel(self) -> None:
+        if self.cancelled:
+            return
+        self.cancelled = True
+        # lazily removed from the heap, don't keep the thread alive until then
+        self.thread = self.kwargs = None
+        if self.manager is not None:
+            self.manager._closure_cancelled()
+
+
 class ThreadManager:
     """Class that handles storing, finding and creating Modmail threads."""
 
     def __init__(self, bot):
         self.bot = bot
         self.cache = {}
+        self._closure_heap: typing.List[ScheduledClosure] = []
+        self._cancelled_closures = 0
+        self._closure_event = None  # created on the running loop with the reaper
+        self._closure_reaper = None
+        self._topic_index: typing.Dict[int, discord.TextChannel] = {}
+        self._topic_index_built = False
+        self._process_pool = None
+        self._process_pool_users = 0
+        self._process_pool_idle: typing.Optional[asyncio.TimerHandle] = None
+        self._pending_config_flush: typing.Optional[asyncio.TimerHandle] = None
+
+    async def run_in_process_pool(self, func, *args):
+        """
+        Runs CPU bound work such as sticker rendering, which would hold the GIL
+        in a thread pool, in a worker process. The worker is started on demand
+        and exits once it has been idle for a while.
+        """
+        if self._process_pool_idle is not None:
+            self._process_pool_idle.cancel()
+            self._process_pool_idle = None
+
+        if self._process_pool is None:
+            # the bot is multi-threaded by now, forking it could deadlock the worker
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            )
+        pool = self._process_pool
+
+        self._process_pool_users += 1
+        try:
+            return await self.bot.loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            # the worker died, start a fresh pool on the next use
+            if self._process_pool is pool:
+                self.shutdown()
+            raise
+        finally:
+            self._process_pool_users -= 1
+            if not self._process_pool_users and self._process_pool is not None:
+                self._process_pool_idle = self.bot.loop.call_later(PROCESS_POOL_IDLE_TIMEOUT, self.shutdown)
+
+    def shutdown(self) -> None:
+        """Releases the worker process, if one was started."""
+        if self._process_pool_idle is not None:
+            self._process_pool_idle.cancel()
+            self._process_pool_idle = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False)
+            self._process_pool = None
+
+    def schedule_closure(self, thread: Thread, after: float, **kwargs) -> ScheduledClosure:
+        """Schedules `thread` to be closed after `after` seconds by the closure reaper."""
+        closure = ScheduledClosure(self, time.monotonic() + after, thread, kwargs)
+        heapq.heappush(self._closure_heap, closure)
+
+        if self._closure_reaper is None or self._closure_reaper.done():
+            if self._closure_event is None:
+                self._closure_event = asyncio.Event()
+            self._closure_reaper = self.bot.loop.create_task(self._run_closure_reaper())
+        self._closure_event.set()
+        return closure
+
+    def _closure_cancelled(self) -> None:
+        self._cancelled_closures += 1
+        # compact the heap once it is mostly made up of cancelled closures
+        if self._cancelled_closures * 2 > len(self._closure_heap):
+            for closure in self._closure_heap:
+                if closure.cancelled:
+                    closure.manager = None
+            self._closure_heap[:] = [c for c in self._closure_heap if not c.cancelled]
+            heapq.heapify(self._closure_heap)
+            self._cancelled_closures = 0
+
+    def _pop_closure(self) -> ScheduledClosure:
+        closure = heapq.heappop(self._closure_heap)
+        closure.manager = None
+        if closure.cancelled:
+            self._cancelled_closures -= 1
+        return closure
+
+    async def _run_closure_reaper(self) -> None:
+        """
+        A single long-lived task that sleeps until the next closure deadline,
+        instead of keeping one sleeping task per scheduled thread closure.
+        """
+        heap = self._closure_heap
+        while True:
+            try:
+                self._closure_event.clear()
+
+                while heap and heap[0].cancelled:
+                    self._pop_closure()
+
+                timeout = max(heap[0].deadline - time.monotonic(), 0) if heap else None
+                try:
+                    await asyncio.wait_for(self._closure_event.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+                now = time.monotonic()
+                while heap and heap[0].deadline <= now:
+                    closure = self._pop_closure()
+                    if not closure.cancelled:
+                        _spawn(closure.thread._close(**closure.kwargs, scheduled=True))
+            except Exception:
+                # keep the reaper alive, the other pending closures depend on it
+                logger.error("Failed to process scheduled thread closures.", exc_info=True)
+                await asyncio.sleep(1)
+
+    def schedule_config_flush(self, delay: float = 1.0) -> None:
+        """
+        Persists the config after `delay` seconds, coalescing every flush
+        requested in the meantime into that single update.
+        """
+        if self._pending_config_flush is None:
+            self._pending_config_flush = self.bot.loop.call_later(delay, self._flush_config)
+
+    def _flush_config(self) -> None:
+        self._pending_config_flush = None
+        _spawn(self.bot.config.update())
 
     async def populate_cache(self) -> None:
-        for channel in self.bot.modmail_guild.text_channels:
-            await self.find(channel=channel)
+        self.build_topic_index()
+        await asyncio.gather(
+            *(self.find(channel=channel) for channel in self.bot.modmail_guild.text_channels)
+        )
+
+    def build_topic_index(self) -> bool:
+        """
+        Rebuilds the recipient ID index from the live channels of the Modmail guild.
+        Returns False if the guild isn't available yet.
+        """
+        guild = self.bot.modmail_guild
+        if guild is None:
+            return False
+
+        self._topic_index.clear()
+        for channel in guild.text_channels:
+            self.index_channel(channel)
+        self._topic_index_built = True
+        return True
+
+    def invalidate_topic_index(self) -> None:
+        """Marks the index as outdated, e.g. when channel events may have been missed."""
+        self._topic_index_built = False
+
+    def index_channel(self, channel: discord.TextChannel) -> None:
+        """Maps the recipient IDs found in the channel topic to the channel."""
+        _, user_id, other_ids = parse_channel_topic(channel.topic)
+        if user_id != -1:
+            self._topic_index[user_id] = channel
+        for uid in other_ids:
+            # a recipient's own thread takes precedence over being an other recipient
+            self._topic_index.setdefault(uid, channel)
+
+    def unindex_channel(self, channel: discord.TextChannel) -> None:
+        """Removes the recipient IDs found in the channel topic from the index."""
+        _, user_id, other_ids = parse_channel_topic(channel.topic)
+        removed = set()
+        for uid in (user_id, *other_ids):
+            if self._topic_index.get(uid) == channel:
+                del self._topic_index[uid]
+                removed.add(uid)
+
+        if removed:
+            self._reindex_recipients(removed, exclude=channel)
+
+    def _reindex_recipients(self, recipient_ids: typing.Set[int], exclude: discord.TextChannel) -> None:
+        """Indexes the other channels that still mention any of the recipients."""
+        for other in self.bot.modmail_guild.text_channels:
+            if other == exclude:
+                continue
+            _, uid, oids = parse_channel_topic(other.topic)
+            if uid in recipient_ids or not recipient_ids.isdisjoint(oids):
+                self.index_channel(other)
 
     def __len__(self):
         return len(self.cache)
@@ -1318,10 +1550,23 @@ class ThreadManager:
                 _, user_id, other_ids = parse_channel_topic(topic)
                 return recipient_id == user_id or recipient_id in other_ids
 
-            channel = discord.utils.find(
-                lambda x: (check(x.topic)) if x.topic else False,
-                self.bot.modmail_guild.text_channels,
-            )
+            if self._topic_index_built or self.build_topic_index():
+                channel = self._topic_index.get(recipient_id)
+                if channel is not None and self.bot.get_channel(channel.id) is None:
+                    # the index can be stale, e.g. the channel was deleted while disconnected
+                    del self._topic_index[recipient_id]
+                    self._reindex_recipients({recipient_id}, exclude=channel)
+                    channel = self._topic_index.get(recipient_id)
+
+                if channel is not None:
+                    channel = self.bot.get_channel(channel.id)
+                if channel is not None and not (channel.topic and check(channel.topic)):
+                    channel = None
+            else:
+                channel = discord.utils.find(
+                    lambda x: (check(x.topic)) if x.topic else False,
+                    self.bot.modmail_guild.text_channels,
+                )
 
             if channel:
                 thread = await Thread.from_channel(self, channel)
@@ -1403,9 +1648,7 @@ class ThreadManager:
                     logger.warning("Found an existing thread for %s, abort creating.", recipient)
                     return thread
                 logger.warning("Found an existing thread for %s, closing previous thread.", recipient)
-                self.bot.loop.create_task(
-                    thread.close(closer=self.bot.user, silent=True, delete_channel=False)
-                )
+                _spawn(thread.close(closer=self.bot.user, silent=True, delete_channel=False))
 
         thread = Thread(self, recipient)
 
@@ -1441,7 +1684,7 @@ class ThreadManager:
                 )
             except asyncio.TimeoutError:
                 thread.cancelled = True
-                self.bot.loop.create_task(
+                _spawn(
                     destination.send(
                         embed=discord.Embed(
                             title=self.bot.config["thread_cancelled"],
@@ -1453,7 +1696,7 @@ class ThreadManager:
             else:
                 if str(r.emoji) == deny_emoji:
                     thread.cancelled = True
-                    self.bot.loop.create_task(
+                    _spawn(
                         destination.send(
                             embed=discord.Embed(
                                 title=self.bot.config["thread_cancelled"], color=self.bot.error_color
@@ -1466,12 +1709,12 @@ class ThreadManager:
                     await confirm.remove_reaction(emoji, self.bot.user)
                     await asyncio.sleep(0.2)
 
-            self.bot.loop.create_task(remove_reactions())
+            _spawn(remove_reactions())
             if thread.cancelled:
                 del self.cache[recipient.id]
                 return thread
 
-        self.bot.loop.create_task(thread.setup(creator=creator, category=category, initial_message=message))
+        _spawn(thread.setup(creator=creator, category=category, initial_message=message))
         return thread
 
     async def find_or_create(self, recipient) -> Thread:
@@ -130,6 +130,13 @@ def format_preview(messages: typing.List[typing.Dict[str, typing.Any]]):
     return out or "No Messages"
 
 
+IMAGE_EXTENSIONS = (".png", ".jpg", ".gif", ".jpeg", ".webp")
+
+GYAZO_REGEX = re.compile(
+    r"(http[s]?:\/\/)((?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+)"
+)
+
+
 def is_image_url(url: str, **kwargs) -> str:
     """
     Check if the URL is pointing to an image.
@@ -144,13 +151,9 @@ def is_image_url(url: str, **kwargs) -> str:
     bool
         Whether the URL is a valid image URL.
     """
-    if url.startswith("https://gyazo.com") or url.startswith("http://gyazo.com"):
+    if url.startswith(("https://gyazo.com", "http://gyazo.com")):
         # gyazo support
-        url = re.sub(
-            r"(http[s]?:\/\/)((?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+)",
-            r"\1i.\2.png",
-            url,
-        )
+        url = GYAZO_REGEX.sub(r"\1i.\2.png", url)
 
     return parse_image_url(url, **kwargs)
 
@@ -169,10 +172,9 @@ def parse_image_url(url: str, *, convert_size=True) -> str:
     str
         The converted URL, or '' if the URL isn't in the proper format.
     """
-    types = [".png", ".jpg", ".gif", ".jpeg", ".webp"]
     url = parse.urlsplit(url)
 
-    if any(url.path.lower().endswith(i) for i in types):
+    if url.path.lower().endswith(IMAGE_EXTENSIONS):
         if convert_size:
             return parse.urlunsplit((*url[:3], "size=128", url[-1]))
         else: